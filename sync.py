@@ -6,8 +6,11 @@ Usage:
     python sync.py                    # Sync all new conversations
     python sync.py --init             # Initialize config
     python sync.py --status           # Show sync status
+    python sync.py --daemon           # Keep running, syncing as sessions change
 """
 
+import calendar
+import functools
 import json
 import os
 import platform
@@ -15,37 +18,123 @@ import subprocess
 import socket
 import getpass
 import re
+import shlex
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any, Set
+from typing import Optional, List, Dict, Any, Set, BinaryIO
 import argparse
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+
+# === JSON ===
+
+# orjson is optional; fall back to the stdlib codec when it isn't installed.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib exception either way.
+#
+# orjson is also stricter than the stdlib: it rejects valid JSON such as lone
+# surrogate escapes (Node cutting tool output mid-emoji) and NaN, and can't
+# encode the strings those decode to. Such records go through the stdlib.
+if orjson is not None:
+    def json_loads(data: bytes) -> Any:
+        """Parse a JSON document, retrying with the stdlib if orjson rejects it."""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError as e:
+            try:
+                return json.loads(data)
+            except UnicodeDecodeError:
+                raise e from None
+
+    def json_dumps_line(obj: Any) -> bytes:
+        """Serialize obj as a single newline-terminated JSONL record."""
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            return (json.dumps(obj) + "\n").encode()
+else:
+    json_loads = json.loads
+
+    def json_dumps_line(obj: Any) -> bytes:
+        """Serialize obj as a single newline-terminated JSONL record."""
+        return (json.dumps(obj) + "\n").encode()
+
+
+def json_dumps_metadata(obj: Any) -> bytes:
+    """Serialize a metadata document.
+
+    Always the stdlib with indent=2, so every machine writing to the shared
+    metadata/ dir produces the same layout whether or not orjson is
+    installed; it runs once per session, so the encoder speed doesn't matter.
+    """
+    return json.dumps(obj, indent=2).encode()
+
 
 # === Configuration ===
 
+# Resolved once per process; sync.py may be invoked on every session end
+_HOME = Path.home()
+_HOSTNAME = socket.gethostname()
+
+# Machine info recorded with every session; none of it changes while the
+# process runs. (The timezone can, across DST in daemon mode, so it's looked
+# up per sync run instead.)
+try:
+    _USERNAME = getpass.getuser()
+except (KeyError, OSError):
+    # No USER/LOGNAME and no passwd entry, e.g. an arbitrary-UID container
+    _USERNAME = None
+_PLATFORM = platform.system().lower()
+_PLATFORM_VERSION = platform.release()
+
+
 def get_config_path() -> Path:
-    return Path.home() / ".claude-sync" / "config.json"
+    return _HOME / ".claude-sync" / "config.json"
 
 
 def get_default_config() -> dict:
     return {
-        "machine_id": socket.gethostname(),
-        "sync_repo_path": str(Path.home() / ".claude-sync" / "repo"),
-        "claude_projects_path": str(Path.home() / ".claude" / "projects"),
+        "machine_id": _HOSTNAME,
+        "sync_repo_path": str(_HOME / ".claude-sync" / "repo"),
+        "claude_projects_path": str(_HOME / ".claude" / "projects"),
         "sync_on_save": True,
         "include_thinking": False,  # Extended thinking blocks can be large
+        "compress_sessions": False,  # Write sessions as .jsonl.zst (needs zstandard)
         "github_token": "",
         "github_repo": "tim0120/claude-sync-data",
     }
 
 
-def load_config() -> dict:
-    config_path = get_config_path()
+@functools.lru_cache(maxsize=1)
+def _read_config_file(config_path: Path) -> Optional[dict]:
     if config_path.exists():
-        with open(config_path) as f:
-            return {**get_default_config(), **json.load(f)}
-    return get_default_config()
+        with open(config_path, "rb") as f:
+            return json_loads(f.read())
+    return None
+
+
+def load_config() -> dict:
+    # Each call gets a fresh dict, so callers can modify it without
+    # touching the cached file contents
+    user_config = _read_config_file(get_config_path())
+    return {**get_default_config(), **(user_config or {})}
 
 
 def save_config(config: dict):
@@ -53,31 +142,57 @@ def save_config(config: dict):
     config_path.parent.mkdir(parents=True, exist_ok=True)
     with open(config_path, "w") as f:
         json.dump(config, f, indent=2)
+    _read_config_file.cache_clear()
     print(f"Config saved to {config_path}")
 
 
 # === Git Helpers ===
 
 def run_git(repo_path: Path, *args) -> subprocess.CompletedProcess:
-    """Run a git command in the specified repo."""
+    """Run a git command in the specified repo. Output is left as bytes."""
     return subprocess.run(
         ["git", "-C", str(repo_path)] + list(args),
         capture_output=True,
-        text=True,
     )
 
 
+def run_git_batch(
+    repo_path: Path, *commands, sep: str = " && ", input: Optional[bytes] = None
+) -> subprocess.CompletedProcess:
+    """Run several git commands in the specified repo with a single shell spawn.
+
+    Each command is a sequence of git arguments; arguments are shell-quoted, so
+    user-controlled values (machine_id, commit messages) are safe to pass.
+    input, if given, is fed to the first command that reads stdin. Output is
+    left as bytes.
+    """
+    script = sep.join(
+        shlex.join(["git", "-C", str(repo_path)] + list(args)) for args in commands
+    )
+    return subprocess.run(script, shell=True, capture_output=True, input=input)
+
+
+def _decode(output: bytes) -> str:
+    """Decode captured git output for display."""
+    return output.strip().decode("utf-8", "replace")
+
+
 def get_git_remote(path: Path) -> Optional[str]:
     """Get the git remote URL for a path, if it's in a git repo."""
+    return _git_remote_cached(str(path))
+
+
+@functools.lru_cache(maxsize=None)
+def _git_remote_cached(cwd_str: str) -> Optional[str]:
+    # Many sessions share a working directory; only spawn git once per cwd
     try:
         result = subprocess.run(
-            ["git", "-C", str(path), "remote", "get-url", "origin"],
+            ["git", "-C", cwd_str, "remote", "get-url", "origin"],
             capture_output=True,
-            text=True,
             timeout=5,
         )
         if result.returncode == 0:
-            return result.stdout.strip()
+            return _decode(result.stdout)
     except:
         pass
     return None
@@ -89,46 +204,96 @@ def get_git_branch(path: Path) -> Optional[str]:
         result = subprocess.run(
             ["git", "-C", str(path), "branch", "--show-current"],
             capture_output=True,
-            text=True,
             timeout=5,
         )
         if result.returncode == 0:
-            return result.stdout.strip()
+            return _decode(result.stdout)
     except:
         pass
     return None
 
 
-def get_git_commit(path: Path) -> Optional[str]:
-    """Get current git commit hash for a path."""
+def get_git_info(path: Path) -> dict:
+    """Get commit and dirty state for a path with a single git call.
+
+    `status --porcelain=v2 --branch` reports HEAD's oid in a header line and
+    any changes as entry lines, replacing separate rev-parse/status spawns;
+    --no-ahead-behind skips the upstream commit walk. Values are None if it
+    isn't a git repo.
+    """
+    info = {"commit": None, "dirty": None}
     try:
         result = subprocess.run(
-            ["git", "-C", str(path), "rev-parse", "HEAD"],
+            ["git", "-C", str(path), "--no-optional-locks",
+             "status", "--porcelain=v2", "--branch", "--no-ahead-behind"],
             capture_output=True,
-            text=True,
             timeout=5,
         )
         if result.returncode == 0:
-            return result.stdout.strip()[:12]  # Short hash
+            dirty = False
+            for line in result.stdout.splitlines():
+                if line.startswith(b"# branch.oid "):
+                    oid = line[13:]
+                    if oid != b"(initial)":
+                        info["commit"] = oid[:12].decode("ascii")  # Short hash
+                elif not line.startswith(b"#"):
+                    dirty = True
+            info["dirty"] = dirty
     except:
         pass
-    return None
+    return info
 
 
-def get_git_dirty(path: Path) -> Optional[bool]:
-    """Check if git repo has uncommitted changes."""
+def _get_git_context_pygit2(path: Path) -> tuple:
+    """Get (remote, commit, dirty) for a path in-process with libgit2.
+
+    Raises pygit2.GitError for repos libgit2 can't handle (e.g. bare);
+    callers fall back to the git CLI.
+    """
+    repo_dir = pygit2.discover_repository(str(path))
+    if repo_dir is None:
+        return None, None, None
+    repo = pygit2.Repository(repo_dir)
     try:
-        result = subprocess.run(
-            ["git", "-C", str(path), "status", "--porcelain"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            return len(result.stdout.strip()) > 0
-    except:
-        pass
-    return None
+        remote = repo.remotes["origin"].url
+    except KeyError:
+        remote = None
+    commit = None if repo.head_is_unborn else str(repo.head.target)[:12]
+    # Older libgit2 defaults report ignored files too; porcelain status doesn't
+    dirty = any(
+        flags != pygit2.GIT_STATUS_IGNORED for flags in repo.status().values()
+    )
+    return remote, commit, dirty
+
+
+# Per-run memo of resolved cwd -> (remote, commit, dirty), so sessions sharing
+# a working directory only query git once. Cleared at the start of every sync
+# batch so a long-running daemon doesn't keep reporting a stale commit.
+_git_context_cache: Dict[Path, tuple] = {}
+
+
+def get_git_context(path: Path) -> tuple:
+    """Get (remote, commit, dirty) for a path, memoized for the current sync run."""
+    key = path.resolve()
+    if key not in _git_context_cache:
+        context = None
+        if pygit2 is not None:
+            # No fork/exec per working directory when libgit2 is available
+            try:
+                context = _get_git_context_pygit2(key)
+            except (pygit2.GitError, ValueError):
+                pass
+        if context is None:
+            info = get_git_info(key)
+            context = (get_git_remote(key), info["commit"], info["dirty"])
+        _git_context_cache[key] = context
+    return _git_context_cache[key]
+
+
+def clear_git_cache():
+    """Forget memoized git lookups."""
+    _git_context_cache.clear()
+    _git_remote_cached.cache_clear()
 
 
 def init_sync_repo(repo_path: Path, remote_url: Optional[str] = None):
@@ -154,6 +319,7 @@ This repository contains synced Claude Code conversations from multiple machines
 sessions/
   <date>/
     <session-id>.jsonl      # Raw conversation (thinking stripped)
+                            # (.jsonl.zst when compress_sessions is on)
 metadata/
   <session-id>.json         # Rich metadata (machine, git, tokens, etc.)
 ```
@@ -181,8 +347,16 @@ Each session includes:
 - Timestamps: started_at, ended_at, synced_at
 """)
 
-        run_git(repo_path, "add", ".")
-        run_git(repo_path, "commit", "-m", "Initial commit")
+        # Compressed sessions are opaque to git's text diff/merge
+        (repo_path / ".gitattributes").write_text("*.jsonl.zst binary\n")
+
+        # Stage just the files written above; nothing else belongs in the
+        # initial commit
+        run_git_batch(
+            repo_path,
+            ("add", "--", "README.md", ".gitattributes"),
+            ("commit", "-m", "Initial commit"),
+        )
 
         if remote_url:
             run_git(repo_path, "remote", "add", "origin", remote_url)
@@ -194,19 +368,86 @@ Each session includes:
 
 # === Metadata Extraction ===
 
+# Session files are read and written sequentially; a large buffer keeps the
+# read/write syscall count down on long sessions
+IO_BUFFER_SIZE = 1 << 20
+
+
+# Path components that never name a project (home directory parents)
+_NON_PROJECT_DIRS = frozenset(("Users", "home", "root"))
+
+
+@functools.lru_cache(maxsize=4096)
 def extract_project_name(path: str) -> str:
     """Extract a human-readable project name from a path."""
-    if not path:
-        return "unknown"
     # Get the last meaningful directory component
-    parts = [p for p in path.split("/") if p and p not in ("Users", "home", "root")]
-    if parts:
-        return parts[-1]
+    for part in reversed(path.split("/")):
+        if part and part not in _NON_PROJECT_DIRS:
+            return part
     return "unknown"
 
 
-def extract_session_metadata(session_path: Path, config: dict) -> dict:
-    """Extract rich metadata from a session file."""
+def _parse_ts(ts: str) -> float:
+    """Parse a YYYY-MM-DDTHH:MM:SS[.fff]Z timestamp to epoch seconds.
+
+    That's the fixed layout Claude Code writes, so it's sliced straight into
+    calendar.timegm. Raises ValueError for anything else.
+    """
+    if not (len(ts) >= 20 and ts[-1] == "Z" and ts[10] == "T" and ts[19] in ".Z"):
+        raise ValueError(f"not a UTC timestamp: {ts!r}")
+    frac = ts[20:-1]
+    seconds = float(calendar.timegm((
+        int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+        int(ts[11:13]), int(ts[14:16]), int(ts[17:19]), 0, 0, 0,
+    )))
+    return seconds + int(frac[:6].ljust(6, "0")) / 1e6 if frac else seconds
+
+
+def _duration_seconds(started_at: str, ended_at: str) -> float:
+    """Seconds between two ISO-8601 timestamps.
+
+    Raises ValueError/TypeError for unparseable timestamps or a mix of naive
+    and timezone-aware ones.
+    """
+    try:
+        return _parse_ts(ended_at) - _parse_ts(started_at)
+    except ValueError:
+        # Not the fixed layout; datetime handles offsets and refuses to
+        # subtract a naive timestamp from an aware one
+        start = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
+        end = datetime.fromisoformat(ended_at.replace("Z", "+00:00"))
+        return (end - start).total_seconds()
+
+
+def get_local_tz_name() -> Optional[str]:
+    """Get the local timezone abbreviation, or None if it can't be determined."""
+    try:
+        return datetime.now().astimezone().tzname()
+    except:
+        return None
+
+
+def utc_now_iso() -> str:
+    """Get the current UTC time as an ISO 8601 string with a Z suffix."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def extract_session_metadata(
+    session_path: Path,
+    config: dict,
+    dst: Optional[BinaryIO] = None,
+    tz_name: Optional[str] = None,
+    synced_at: Optional[str] = None,
+) -> dict:
+    """Extract rich metadata from a session file.
+
+    If dst is given, the session is also written to it in the same pass, so
+    syncing only reads and parses the file once: verbatim when the config's
+    include_thinking is set, otherwise with thinking blocks stripped.
+
+    tz_name and synced_at are normally computed once per sync run by the
+    caller; they're looked up here only if not given.
+    """
 
     # Parse the project path from the directory name
     # Format: -Users-timkostolansky-Developer-workshop-labs-timbox
@@ -225,6 +466,7 @@ def extract_session_metadata(session_path: Path, config: dict) -> dict:
     cwd = None
     model_used = None
     claude_version = None
+    context_found = False
 
     # Token tracking
     total_input_tokens = 0
@@ -242,25 +484,42 @@ def extract_session_metadata(session_path: Path, config: dict) -> dict:
     is_agent_session = session_id.startswith("agent-")
     parent_session_id = None
 
-    with open(session_path) as f:
+    # Stat before reading: anything appended while we read shows up as growth
+    # on the next run instead of being recorded as already synced
+    source_size = session_path.stat().st_size
+
+    # Exactly one of these is set when writing a copy
+    raw_dst = filter_dst = None
+    if dst is not None:
+        if config.get("include_thinking", False):
+            raw_dst = dst
+        else:
+            filter_dst = dst
+
+    with open(session_path, "rb", buffering=IO_BUFFER_SIZE) as f:
         for line in f:
+            if raw_dst is not None:
+                raw_dst.write(line)
             if not line.strip():
                 continue
             try:
-                msg = json.loads(line)
+                msg = json_loads(line)
                 message_count += 1
 
                 if first_msg is None:
                     first_msg = msg
                 last_msg = msg
 
-                # Extract basic info from any message
-                if "gitBranch" in msg and not git_branch:
-                    git_branch = msg["gitBranch"]
-                if "cwd" in msg and not cwd:
-                    cwd = msg["cwd"]
-                if "version" in msg and not claude_version:
-                    claude_version = msg["version"]
+                # Extract basic info from any message; each field only needs
+                # its first occurrence, so stop probing once all are found
+                if not context_found:
+                    if "gitBranch" in msg and not git_branch:
+                        git_branch = msg["gitBranch"]
+                    if "cwd" in msg and not cwd:
+                        cwd = msg["cwd"]
+                    if "version" in msg and not claude_version:
+                        claude_version = msg["version"]
+                    context_found = bool(git_branch and cwd and claude_version)
 
                 # Count by type
                 msg_type = msg.get("type", "")
@@ -282,9 +541,16 @@ def extract_session_metadata(session_path: Path, config: dict) -> dict:
                         total_cache_read_tokens += usage.get("cache_read_input_tokens", 0)
                         total_cache_creation_tokens += usage.get("cache_creation_input_tokens", 0)
 
-                        # Tool calls in content
+                        # Tool calls in content. A tool_use block can't be
+                        # there without its type string in the raw line, so
+                        # most records skip the content walk entirely.
                         content = message_data.get("content", [])
-                        if isinstance(content, list):
+                        if isinstance(content, list) and b'"tool_use"' in line:
+                            track_files = (
+                                b'"Edit"' in line
+                                or b'"Write"' in line
+                                or b'"NotebookEdit"' in line
+                            )
                             for item in content:
                                 if isinstance(item, dict) and item.get("type") == "tool_use":
                                     tool_calls_count += 1
@@ -292,13 +558,29 @@ def extract_session_metadata(session_path: Path, config: dict) -> dict:
                                     tools_used.add(tool_name)
 
                                     # Track files modified by Edit/Write tools
-                                    if tool_name in ("Edit", "Write", "NotebookEdit"):
+                                    if track_files and tool_name in ("Edit", "Write", "NotebookEdit"):
                                         tool_input = item.get("input", {})
                                         file_path = tool_input.get("file_path") or tool_input.get("notebook_path")
                                         if file_path:
                                             files_modified.add(file_path)
 
+                if filter_dst is not None:
+                    # Remove thinking blocks from assistant messages. Only
+                    # records that actually carry one are re-serialized (the
+                    # byte check rules out most lines without touching the
+                    # content list); everything else is written verbatim.
+                    if msg_type == "assistant" and b'"thinking"' in line and "message" in msg:
+                        content = msg["message"].get("content", [])
+                        if isinstance(content, list):
+                            kept = [c for c in content if c.get("type") != "thinking"]
+                            if len(kept) != len(content):
+                                msg["message"]["content"] = kept
+                                line = json_dumps_line(msg)
+                    filter_dst.write(line if line.endswith(b"\n") else line + b"\n")
+
             except json.JSONDecodeError:
+                if filter_dst is not None:
+                    filter_dst.write(line)
                 continue
 
     # Get git info from working directory
@@ -308,9 +590,7 @@ def extract_session_metadata(session_path: Path, config: dict) -> dict:
     if cwd:
         cwd_path = Path(cwd)
         if cwd_path.exists():
-            git_remote = get_git_remote(cwd_path)
-            git_commit = get_git_commit(cwd_path)
-            git_dirty = get_git_dirty(cwd_path)
+            git_remote, git_commit, git_dirty = get_git_context(cwd_path)
 
     # Calculate session duration
     started_at = None
@@ -322,17 +602,14 @@ def extract_session_metadata(session_path: Path, config: dict) -> dict:
         ended_at = last_msg["timestamp"]
     if started_at and ended_at:
         try:
-            start = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
-            end = datetime.fromisoformat(ended_at.replace("Z", "+00:00"))
-            duration_seconds = round((end - start).total_seconds(), 2)
+            duration_seconds = round(_duration_seconds(started_at, ended_at), 2)
         except (ValueError, TypeError):
             pass
 
-    # Get system info
-    try:
-        tz_name = datetime.now().astimezone().tzname()
-    except:
-        tz_name = None
+    if tz_name is None:
+        tz_name = get_local_tz_name()
+    if synced_at is None:
+        synced_at = utc_now_iso()
 
     return {
         # Identity
@@ -343,9 +620,9 @@ def extract_session_metadata(session_path: Path, config: dict) -> dict:
         # Machine info
         "machine_id": config["machine_id"],
         "hostname": config["machine_id"],
-        "username": getpass.getuser(),
-        "platform": platform.system().lower(),
-        "platform_version": platform.release(),
+        "username": _USERNAME,
+        "platform": _PLATFORM,
+        "platform_version": _PLATFORM_VERSION,
         "timezone": tz_name,
 
         # Project/path info
@@ -383,86 +660,483 @@ def extract_session_metadata(session_path: Path, config: dict) -> dict:
         "started_at": started_at,
         "ended_at": ended_at,
         "duration_seconds": duration_seconds,
-        "synced_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "synced_at": synced_at,
 
         # Source reference
         "source_file": str(session_path),
-        "synced_file_size": session_path.stat().st_size,
+        "synced_file_size": source_size,
     }
 
 
+def peek_started_at(session_path: Path) -> Optional[str]:
+    """Get the session start timestamp by reading only up to the first record."""
+    with open(session_path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                msg = json_loads(line)
+            except json.JSONDecodeError:
+                continue
+            return msg.get("timestamp") if isinstance(msg, dict) else None
+    return None
+
+
+def get_session_date(session_path: Path, default: str) -> str:
+    """Get the YYYY-MM-DD date folder for a session, or default if undated."""
+    started_at = peek_started_at(session_path)
+    if not started_at:
+        return default
+    if not isinstance(started_at, str):
+        raise TypeError(f"timestamp is not a string: {started_at!r}")
+    return started_at[:10]
+
+
 # === Sync Logic ===
 
-def get_synced_sessions(repo_path: Path) -> dict:
-    """Get map of session_id -> synced_file_size from metadata dir."""
+def get_git_dir(repo_path: Path) -> Optional[Path]:
+    """Get the sync repo's git dir, or None if it isn't a git repo.
+
+    .git may be a gitfile pointing elsewhere (a worktree, a submodule,
+    --separate-git-dir), so ask git rather than assuming repo_path/.git.
+    """
+    try:
+        return _git_dir_cached(os.path.abspath(repo_path))
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _git_dir_cached(repo_str: str) -> Path:
+    # Raises on failure, so only a successful lookup is cached
+    result = subprocess.run(
+        ["git", "-C", repo_str, "rev-parse", "--absolute-git-dir"],
+        capture_output=True,
+        timeout=5,
+    )
+    if result.returncode != 0:
+        raise subprocess.SubprocessError(_decode(result.stderr))
+    return Path(os.fsdecode(result.stdout.rstrip(b"\n")))
+
+
+def get_index_path(repo_path: Path) -> Optional[Path]:
+    """Path of the sync index; it lives in the git dir so it is never committed.
+
+    None if repo_path isn't a git repo.
+    """
+    git_dir = get_git_dir(repo_path)
+    return git_dir / "claude-sync-index.json" if git_dir is not None else None
+
+
+def get_pending_path(repo_path: Path) -> Optional[Path]:
+    """Path of the list of written-but-uncommitted files (NUL-separated).
+
+    None if repo_path isn't a git repo.
+    """
+    git_dir = get_git_dir(repo_path)
+    return git_dir / "claude-sync-pending" if git_dir is not None else None
+
+
+def has_pending_files(repo_path: Path) -> bool:
+    """Whether files from an earlier failed commit are still waiting."""
+    pending_path = get_pending_path(repo_path)
+    try:
+        return pending_path is not None and pending_path.stat().st_size > 0
+    except FileNotFoundError:
+        return False
+
+
+def _settled_mtime_ns(metadata_dir: Path) -> Optional[int]:
+    """Get the metadata dir's mtime, or None if it may still change unseen.
+
+    Like git's racy-clean check, a dir modified moments ago may change again
+    within the same timestamp tick, so only an mtime that has settled is
+    trusted.
+    """
+    mtime_ns = metadata_dir.stat().st_mtime_ns
+    if time.time_ns() - mtime_ns < 2_000_000_000:
+        return None
+    return mtime_ns
+
+
+def save_sync_index(repo_path: Path, synced: dict, metadata_mtime_ns: Optional[int]):
+    """Atomically write the session_id -> synced_file_size sync index.
+
+    metadata_mtime_ns must be the metadata dir mtime the synced state was
+    loaded or scanned at, as returned by get_synced_sessions; stamping the
+    current mtime would mark metadata added since then (e.g. by a pull) as
+    seen.
+    """
+    index_path = get_index_path(repo_path)
+    if index_path is None:
+        return
+    index = {"metadata_mtime_ns": metadata_mtime_ns, "sizes": synced}
+    # Hook runs for different sessions can overlap, so each writes its own
+    # temp file; the last replace wins, and every index written is complete
+    fd, tmp_path = tempfile.mkstemp(dir=index_path.parent, prefix=index_path.name + ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(json_dumps_line(index))
+        os.replace(tmp_path, index_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def get_synced_sessions(repo_path: Path) -> tuple:
+    """Get (synced, metadata_mtime_ns) for the repo.
+
+    synced maps session_id -> synced_file_size (-1 if unknown). It's
+    served from the sync index when the metadata dir hasn't changed since the
+    index was written; otherwise only metadata files the index doesn't know
+    about are parsed, and the refreshed index is saved. metadata_mtime_ns is
+    the dir mtime the state reflects, to pass back to save_sync_index.
+    """
     metadata_dir = repo_path / "metadata"
     if not metadata_dir.exists():
-        return {}
+        return {}, None
+
+    index = {}
+    index_path = get_index_path(repo_path)
+    if index_path is not None:
+        try:
+            with open(index_path, "rb") as f:
+                index = json_loads(f.read())
+        except (OSError, ValueError):
+            pass
+    # (An index from before "sizes" has nothing usable and is rebuilt)
+    indexed = index.get("sizes", {})
+    if "sizes" in index and index.get("metadata_mtime_ns") == metadata_dir.stat().st_mtime_ns:
+        return indexed, index["metadata_mtime_ns"]
+
+    # Taken before listing, so anything added during the scan shows up as a
+    # change next time
+    metadata_mtime_ns = _settled_mtime_ns(metadata_dir)
     result = {}
-    for p in metadata_dir.glob("*.json"):
+    for name in os.listdir(metadata_dir):
+        if not name.endswith(".json"):
+            continue
+        session_id = name[:-5]
+        if session_id in indexed:
+            result[session_id] = indexed[session_id]
+            continue
         try:
-            with open(p) as f:
-                m = json.load(f)
+            with open(metadata_dir / name, "rb") as f:
+                m = json_loads(f.read())
             # -1 sentinel = synced but size unknown (old metadata without field)
             # Only re-sync if size was recorded AND file has grown since
-            result[p.stem] = m.get("synced_file_size", -1)
+            result[session_id] = m.get("synced_file_size", -1)
         except Exception:
-            result[p.stem] = -1
-    return result
+            result[session_id] = -1
+    save_sync_index(repo_path, result, metadata_mtime_ns)
+    return result, metadata_mtime_ns
 
 
-def sync_session(session_path: Path, config: dict, repo_path: Path) -> bool:
-    """Sync a single session to the repo. Returns True if synced."""
+def needs_sync(stat: os.stat_result, synced_size: Optional[int]) -> bool:
+    """Whether a session file with this stat has changed since it was synced."""
+    if synced_size is None:
+        return True  # never synced
+    if synced_size < 0:
+        return False  # synced by an older version that didn't record size
+    # Sessions are append-only, so only growth means new messages
+    return stat.st_size > synced_size
 
-    session_id = session_path.stem
 
-    # Extract metadata
-    metadata = extract_session_metadata(session_path, config)
+# ioctl request number for FICLONE (linux/fs.h); Btrfs/XFS reflink in O(1)
+FICLONE = 0x40049409
 
-    # Determine date folder from session start
-    if metadata["started_at"]:
-        date_str = metadata["started_at"][:10]  # YYYY-MM-DD
-    else:
-        date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-    # Create directories (flat structure)
-    session_dir = repo_path / "sessions" / date_str
-    metadata_dir = repo_path / "metadata"
-    session_dir.mkdir(parents=True, exist_ok=True)
-    metadata_dir.mkdir(parents=True, exist_ok=True)
+def clone_session_file(src: Path, dst: str) -> bool:
+    """Copy a session file as a copy-on-write clone. Returns False if unsupported.
 
-    # Copy session file
-    dest_session = session_dir / f"{session_id}.jsonl"
+    Not a hardlink: the source keeps being appended to by Claude Code, and a
+    shared inode would change the synced copy underneath git.
+    """
+    try:
+        import fcntl
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        return True
+    except (ImportError, OSError):
+        return False
+
+
+def sync_session(
+    session_path: Path,
+    config: dict,
+    sessions_base: str,
+    metadata_base: str,
+    tz_name: Optional[str] = None,
+    synced_at: Optional[str] = None,
+    date_str: Optional[str] = None,
+) -> tuple:
+    """Sync a single session to the repo. Returns (metadata, written_paths).
+
+    sessions_base and metadata_base are the repo's sessions/ and metadata/
+    dirs, precomputed as strings by the caller; tz_name and synced_at are
+    shared by every session in the run. date_str is the session's date
+    folder; a caller passing it must already have created that folder and
+    metadata_base. Otherwise it's peeked from the first record here.
+    """
+
+    session_id = session_path.stem
 
-    # Optionally filter out thinking blocks
-    if config.get("include_thinking", False):
-        # Just copy the file as-is
-        import shutil
-        shutil.copy2(session_path, dest_session)
+    if date_str is None:
+        date_str = get_session_date(
+            session_path, datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        )
+        os.makedirs(os.path.join(sessions_base, date_str), exist_ok=True)
+        os.makedirs(metadata_base, exist_ok=True)
+    session_dir = os.path.join(sessions_base, date_str)
+
+    # Copy session file, zstd-compressed if configured
+    compress = config.get("compress_sessions", False) and zstd is not None
+    suffix = ".jsonl.zst" if compress else ".jsonl"
+    dest_session = os.path.join(session_dir, session_id + suffix)
+
+    if config.get("include_thinking", False) and not compress and clone_session_file(
+        session_path, dest_session
+    ):
+        # Reflinked as-is, so only the metadata pass reads the file. Anything
+        # appended after the clone isn't in the copy; record the cloned size
+        # so it's picked up as growth on the next run.
+        metadata = extract_session_metadata(
+            session_path, config, tz_name=tz_name, synced_at=synced_at
+        )
+        metadata["synced_file_size"] = os.path.getsize(dest_session)
     else:
-        # Filter out thinking content to reduce size
-        with open(session_path) as src, open(dest_session, "w") as dst:
-            for line in src:
-                if not line.strip():
-                    continue
-                try:
-                    msg = json.loads(line)
-                    # Remove thinking blocks from assistant messages
-                    if msg.get("type") == "assistant" and "message" in msg:
-                        content = msg["message"].get("content", [])
-                        if isinstance(content, list):
-                            msg["message"]["content"] = [
-                                c for c in content if c.get("type") != "thinking"
-                            ]
-                    dst.write(json.dumps(msg) + "\n")
-                except json.JSONDecodeError:
-                    dst.write(line)
+        # Write the copy while extracting metadata (single pass); thinking
+        # blocks are filtered out unless include_thinking is set
+        with open(dest_session, "wb", buffering=IO_BUFFER_SIZE) as f:
+            if compress:
+                with zstd.ZstdCompressor(level=3).stream_writer(f) as dst:
+                    metadata = extract_session_metadata(
+                        session_path, config, dst, tz_name, synced_at
+                    )
+            else:
+                metadata = extract_session_metadata(
+                    session_path, config, f, tz_name, synced_at
+                )
 
     # Write metadata (flat)
-    metadata_path = metadata_dir / f"{session_id}.json"
-    with open(metadata_path, "w") as f:
-        json.dump(metadata, f, indent=2)
+    metadata_path = os.path.join(metadata_base, session_id + ".json")
+    with open(metadata_path, "wb") as f:
+        f.write(json_dumps_metadata(metadata))
+
+    return metadata, [dest_session, metadata_path]
+
+
+def _sync_session_safe(session_path: Path, date_str: str, **kwargs) -> tuple:
+    """Run sync_session, returning (result, error_message) instead of raising.
+
+    The error goes back as a string so it always survives the trip back from
+    a worker process.
+    """
+    try:
+        return sync_session(session_path, date_str=date_str, **kwargs), None
+    except Exception as e:
+        return None, str(e)
+
+
+def iter_session_files(claude_path: Path):
+    """Yield (entry, session_id) for every session file under claude_path.
+
+    Entries are os.DirEntry objects: scandir hands back d_type from readdir,
+    so no per-entry stat is needed until the caller asks for one.
+    """
+    with os.scandir(claude_path) as projects:
+        for project_dir in projects:
+            if project_dir.name.startswith(".") or not project_dir.is_dir():
+                continue
+            with os.scandir(project_dir.path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".jsonl"):
+                        yield entry, entry.name[:-6]
+
+
+def find_sessions_to_sync(claude_path: Path, synced: dict) -> List[Path]:
+    """Find new or grown (resumed) session files under claude_path."""
+    new_sessions = []
+    for entry, session_id in iter_session_files(claude_path):
+        synced_size = synced.get(session_id)
+        if synced_size is None:
+            new_sessions.append(Path(entry.path))  # never synced
+        elif needs_sync(entry.stat(), synced_size):
+            new_sessions.append(Path(entry.path))  # resumed and grown
+    return new_sessions
+
+
+# Below this many sessions, sync in threads rather than paying for a process pool
+PROCESS_POOL_MIN_SESSIONS = 8
+
+
+def _session_size(session_path: Path) -> int:
+    """Get a session file's size, or 0 if it can't be stat'd."""
+    try:
+        return session_path.stat().st_size
+    except OSError:
+        return 0
+
+
+def sync_sessions(new_sessions: List[Path], config: dict, repo_path: Path) -> tuple:
+    """Sync the given sessions, printing progress.
+
+    Returns (synced_states, written_paths): session_id -> synced_file_size
+    for each session synced, and every file written into the repo.
+    """
+    # Sync sessions concurrently; each writes its own files, so only the
+    # git commit afterwards needs to stay serial. Parsing is CPU-bound, so
+    # big batches (first sync, long offline stretches) go to a process pool;
+    # the usual one-or-two-session run isn't worth the worker startup.
+    # Largest sessions go first: one session is parsed by a single worker,
+    # so a big one started last would leave the rest of the pool idle.
+    new_sessions = sorted(new_sessions, key=_session_size, reverse=True)
+    synced_at = utc_now_iso()
+    sessions_base = str(repo_path / "sessions")
+    metadata_base = str(repo_path / "metadata")
+    worker = functools.partial(
+        _sync_session_safe,
+        config=config,
+        sessions_base=sessions_base,
+        metadata_base=metadata_base,
+        tz_name=get_local_tz_name(),
+        synced_at=synced_at,
+    )
+
+    # Route sessions to their date folders up front; only the first record
+    # of each is read, and undated sessions go under today's (UTC) date.
+    # Each folder is then created once here rather than once per session.
+    # A session that can't be routed fails on its own, like a failed sync.
+    dispatched = []
+    dates = []
+    for session_path in new_sessions:
+        try:
+            dates.append(get_session_date(session_path, synced_at[:10]))
+        except Exception as e:
+            print(f"  ✗ {session_path.stem[:12]}... Error: {e}")
+            continue
+        dispatched.append(session_path)
+    new_sessions = dispatched
+    for date_str in set(dates):
+        os.makedirs(os.path.join(sessions_base, date_str), exist_ok=True)
+    os.makedirs(metadata_base, exist_ok=True)
+
+    synced_states = {}
+    written_paths = []
+    clear_git_cache()
+    cpu_count = os.cpu_count() or 1
+    if len(new_sessions) >= PROCESS_POOL_MIN_SESSIONS:
+        executor = ProcessPoolExecutor(max_workers=max(1, cpu_count * 3 // 4))
+    else:
+        executor = ThreadPoolExecutor(max_workers=min(16, cpu_count * 2))
+    with executor:
+        results = executor.map(worker, new_sessions, dates)
+        for session_path, (result, error) in zip(new_sessions, results):
+            if error is not None:
+                print(f"  ✗ {session_path.stem[:12]}... Error: {error}")
+            elif result:
+                metadata, paths = result
+                written_paths.extend(paths)
+                synced_states[metadata["session_id"]] = metadata["synced_file_size"]
+                print(f"  ✓ {session_path.stem[:12]}... ({extract_project_name(session_path.parent.name)})")
+    return synced_states, written_paths
 
+
+def paths_have_changes(repo_path: Path, paths: List[bytes]) -> bool:
+    """Whether any of the repo-relative paths differ from HEAD (or are untracked)."""
+    result = subprocess.run(
+        ["git", "-C", str(repo_path), "--literal-pathspecs", "--no-optional-locks",
+         "status", "--porcelain", "-z", "--"] + [os.fsdecode(p) for p in paths],
+        capture_output=True,
+    )
+    return result.returncode != 0 or bool(result.stdout)
+
+
+def commit_synced(
+    config: dict, repo_path: Path, written_paths: List[str], push: bool
+) -> bool:
+    """Commit the written files (and optionally push). Returns False if the commit failed.
+
+    Files left over from an earlier failed commit are committed too, so this
+    is worth calling with no written_paths when has_pending_files is true.
+    """
+
+    # Once its metadata exists a session counts as synced, so files from a
+    # failed commit are remembered and staged along with the next one
+    # (remembered as absolute paths, so they stay valid whatever the cwd)
+    pending_path = get_pending_path(repo_path)
+    paths = [os.path.abspath(p) for p in written_paths]
+    if pending_path is not None:
+        try:
+            paths += [
+                os.path.abspath(os.fsdecode(p))
+                for p in pending_path.read_bytes().split(b"\0")
+                if p and os.path.exists(p)
+            ]
+        except FileNotFoundError:
+            pass
+    # A session's files can be pending from more than one failed attempt
+    paths = list(dict.fromkeys(paths))
+    if not paths:
+        # Everything that was pending has since been removed
+        if pending_path is not None:
+            pending_path.unlink(missing_ok=True)
+        return True
+    session_count = sum(
+        1 for p in paths if os.path.basename(os.path.dirname(p)) == "metadata"
+    )
+    commit_msg = f"Sync {session_count} sessions from {config['machine_id']}"
+
+    # git -C resolves paths against the repo dir, so stage repo-relative ones
+    repo_dir = os.path.abspath(repo_path)
+    staged = [os.fsencode(os.path.relpath(p, repo_dir)) for p in paths]
+
+    # Stage exactly the files we wrote rather than having `git add .`
+    # rescan the whole working tree; update-index takes the paths as-is,
+    # without add's pathspec matching
+    commit_result = run_git_batch(
+        repo_path,
+        ("update-index", "--add", "-z", "--stdin"),
+        ("commit", "--no-verify", "-m", commit_msg),
+        input=b"\0".join(staged),
+    )
+    if commit_result.returncode != 0:
+        if not written_paths and not paths_have_changes(repo_path, staged):
+            # Pending files that got committed some other way leave nothing
+            # to commit; that's done, not a failure to retry on every run
+            if pending_path is not None:
+                pending_path.unlink(missing_ok=True)
+            return True
+        print(f"\nCommit failed: {_decode(commit_result.stderr)}")
+        if pending_path is not None:
+            with open(pending_path, "ab") as f:
+                f.write(b"".join(os.fsencode(p) + b"\0" for p in paths[:len(written_paths)]))
+        return False
+    if pending_path is not None:
+        pending_path.unlink(missing_ok=True)
+    print(f"\nCommitted: {commit_msg}")
+
+    if push:
+        # Use HTTPS with token if configured (takes priority over SSH remote)
+        token = config.get("github_token", "")
+        if token:
+            repo_slug = config.get("github_repo", "tim0120/claude-sync-data")
+            https_url = f"https://{token}@github.com/{repo_slug}.git"
+            run_git(repo_path, "remote", "set-url", "origin", https_url)
+
+        for attempt in range(3):
+            pull = run_git(repo_path, "pull", "--rebase", "--no-verify", "origin", "main")
+            if pull.returncode != 0:
+                print(f"Pull failed (attempt {attempt+1}): {_decode(pull.stderr)}")
+            result = run_git(repo_path, "push", "--no-verify")
+            if result.returncode == 0:
+                print("Pushed to remote")
+                break
+            print(f"Push failed (attempt {attempt+1}): {_decode(result.stderr)}")
+            if attempt < 2:
+                time.sleep(2 + attempt * 3)
+        else:
+            print("Push failed after 3 attempts")
     return True
 
 
@@ -482,40 +1156,20 @@ def sync_all(config: dict, push: bool = False) -> dict:
         return {"error": "Claude projects not found"}
 
     # Get already synced sessions (flat)
-    synced = get_synced_sessions(repo_path)
+    synced, metadata_mtime_ns = get_synced_sessions(repo_path)
     print(f"Found {len(synced)} previously-synced sessions")
 
-    # Find new or grown (resumed) sessions
-    new_sessions = []
-    for project_dir in claude_path.iterdir():
-        if not project_dir.is_dir() or project_dir.name.startswith("."):
-            continue
-        for session_file in project_dir.glob("*.jsonl"):
-            prev_size = synced.get(session_file.stem)
-            if prev_size is None:
-                new_sessions.append(session_file)  # never synced
-            elif prev_size >= 0 and session_file.stat().st_size > prev_size:
-                new_sessions.append(session_file)  # resumed and grown
-
+    new_sessions = find_sessions_to_sync(claude_path, synced)
     print(f"Found {len(new_sessions)} new/updated sessions to sync")
+    if config.get("compress_sessions", False) and zstd is None:
+        print("compress_sessions is set but zstandard isn't installed; writing uncompressed")
 
-    # Sync each session
-    synced_count = 0
-    for session_path in new_sessions:
-        try:
-            if sync_session(session_path, config, repo_path):
-                synced_count += 1
-                print(f"  ✓ {session_path.stem[:12]}... ({extract_project_name(session_path.parent.name)})")
-        except Exception as e:
-            print(f"  ✗ {session_path.stem[:12]}... Error: {e}")
+    synced_states, written_paths = sync_sessions(new_sessions, config, repo_path)
+    synced_count = len(synced_states)
 
-    # Git commit
-    if synced_count > 0:
-        run_git(repo_path, "add", ".")
-        commit_msg = f"Sync {synced_count} sessions from {machine_id}"
-        commit_result = run_git(repo_path, "commit", "--no-verify", "-m", commit_msg)
-        if commit_result.returncode != 0:
-            print(f"\nCommit failed: {commit_result.stderr.strip()}")
+    # Git commit, also picking up files an earlier failed commit left behind
+    if synced_count > 0 or has_pending_files(repo_path):
+        if not commit_synced(config, repo_path, written_paths, push):
             return {
                 "machine_id": machine_id,
                 "previously_synced": len(synced),
@@ -523,29 +1177,7 @@ def sync_all(config: dict, push: bool = False) -> dict:
                 "total": len(synced) + synced_count,
                 "error": "commit failed",
             }
-        print(f"\nCommitted: {commit_msg}")
-
-        if push:
-            # Use HTTPS with token if configured (takes priority over SSH remote)
-            token = config.get("github_token", "")
-            if token:
-                repo_slug = config.get("github_repo", "tim0120/claude-sync-data")
-                https_url = f"https://{token}@github.com/{repo_slug}.git"
-                run_git(repo_path, "remote", "set-url", "origin", https_url)
-
-            for attempt in range(3):
-                pull = run_git(repo_path, "pull", "--rebase", "--no-verify", "origin", "main")
-                if pull.returncode != 0:
-                    print(f"Pull failed (attempt {attempt+1}): {pull.stderr.strip()}")
-                result = run_git(repo_path, "push", "--no-verify")
-                if result.returncode == 0:
-                    print("Pushed to remote")
-                    break
-                print(f"Push failed (attempt {attempt+1}): {result.stderr.strip()}")
-                if attempt < 2:
-                    time.sleep(2 + attempt * 3)
-            else:
-                print("Push failed after 3 attempts")
+        save_sync_index(repo_path, {**synced, **synced_states}, metadata_mtime_ns)
 
     return {
         "machine_id": machine_id,
@@ -555,6 +1187,96 @@ def sync_all(config: dict, push: bool = False) -> dict:
     }
 
 
+def _watch_sessions(claude_path: Path, interval: float):
+    """Yield batches of session files that may have changed.
+
+    None means "rescan everything"; the first batch is always a rescan. With
+    watchfiles installed, later batches come from filesystem events and only
+    hold the files actually touched; otherwise it rescans every interval.
+    """
+    try:
+        import watchfiles
+    except ImportError:
+        watchfiles = None
+
+    if watchfiles is not None:
+        # Events carry absolute (on some platforms canonical) paths, while
+        # claude_path is whatever the config says
+        root = claude_path.resolve()
+        yield None
+        last_batch = time.monotonic()
+        pending: Set[Path] = set()
+        # watchfiles hands over events as soon as writes pause, i.e. after
+        # nearly every write Claude Code makes; collect them and yield at most
+        # once per interval. The timeout wakes us to flush a batch once its
+        # interval is up even if no further events arrive.
+        for changes in watchfiles.watch(
+            root,
+            watch_filter=lambda change, path: path.endswith(".jsonl"),
+            rust_timeout=min(1000, int(interval * 1000)),
+            yield_on_timeout=True,
+        ):
+            for change, path in changes:
+                # Same layout the rescan covers: <project-dir>/<session>.jsonl
+                p = Path(path)
+                if p.parent.name.startswith("."):
+                    continue
+                if p.parent.parent == root or p.parent.parent.resolve() == root:
+                    pending.add(p)
+            if pending and time.monotonic() - last_batch >= interval:
+                yield sorted(pending)
+                pending = set()
+                last_batch = time.monotonic()
+    else:
+        while True:
+            yield None  # caller rescans
+            time.sleep(interval)
+
+
+def run_daemon(config: dict, push: bool = False, interval: float = 60.0):
+    """Keep syncing from one long-lived process.
+
+    Config and the synced-session state stay in memory between batches, so a
+    change costs a stat and a sync of that session rather than a full
+    process start, index load and directory scan. Changes are batched into
+    one commit per interval.
+    """
+    repo_path = Path(config["sync_repo_path"])
+    claude_path = Path(config["claude_projects_path"])
+
+    if not repo_path.exists():
+        print(f"Sync repo not found at {repo_path}. Run with --init first.")
+        return
+    if not claude_path.exists():
+        print(f"Claude projects not found at {claude_path}")
+        return
+
+    synced, metadata_mtime_ns = get_synced_sessions(repo_path)
+    print(f"Watching {claude_path} ({len(synced)} sessions already synced)")
+
+    for changed in _watch_sessions(claude_path, interval):
+        if changed is None:
+            new_sessions = find_sessions_to_sync(claude_path, synced)
+        else:
+            new_sessions = []
+            for path in changed:
+                try:
+                    st = path.stat()
+                except FileNotFoundError:
+                    continue
+                if needs_sync(st, synced.get(path.stem)):
+                    new_sessions.append(path)
+        if not new_sessions and not has_pending_files(repo_path):
+            continue
+
+        synced_states, written_paths = sync_sessions(new_sessions, config, repo_path)
+        if (synced_states or has_pending_files(repo_path)) and commit_synced(
+            config, repo_path, written_paths, push
+        ):
+            synced.update(synced_states)
+            save_sync_index(repo_path, synced, metadata_mtime_ns)
+
+
 def show_status(config: dict):
     """Show sync status."""
     repo_path = Path(config["sync_repo_path"])
@@ -571,13 +1293,10 @@ def show_status(config: dict):
         return
 
     # Count synced sessions (flat)
-    synced = get_synced_sessions(repo_path)
+    synced, _ = get_synced_sessions(repo_path)
 
     # Count total local sessions
-    total_local = 0
-    for project_dir in claude_path.iterdir():
-        if project_dir.is_dir() and not project_dir.name.startswith("."):
-            total_local += len(list(project_dir.glob("*.jsonl")))
+    total_local = sum(1 for _ in iter_session_files(claude_path))
 
     pending = total_local - len(synced)
 
@@ -585,15 +1304,20 @@ def show_status(config: dict):
     print(f"Synced: {len(synced)}")
     print(f"Pending: {pending}")
 
-    # Check git status
-    result = run_git(repo_path, "status", "--porcelain")
-    if result.stdout.strip():
+    # Check git status and remote in one spawn; NUL separates the two outputs
+    result = run_git_batch(
+        repo_path,
+        ("status", "--porcelain"),
+        ("remote", "-v"),
+        sep="; printf '\\0'; ",
+    )
+    status_out, _, remote_out = result.stdout.partition(b"\0")
+    if status_out.strip():
         print("\nUncommitted changes in sync repo")
 
     # Check remote
-    result = run_git(repo_path, "remote", "-v")
-    if result.stdout.strip():
-        print(f"\nRemote: {result.stdout.strip().split()[1]}")
+    if remote_out.strip():
+        print(f"\nRemote: {_decode(remote_out).split()[1]}")
     else:
         print("\nNo remote configured")
 
@@ -607,6 +1331,8 @@ def main():
     parser.add_argument("--push", action="store_true", help="Push to remote after sync")
     parser.add_argument("--remote", type=str, help="Git remote URL (for --init)")
     parser.add_argument("--machine-id", type=str, help="Override machine ID")
+    parser.add_argument("--daemon", action="store_true", help="Keep running and sync sessions as they change")
+    parser.add_argument("--interval", type=float, default=60.0, help="Seconds between daemon sync batches (default: 60)")
 
     args = parser.parse_args()
 
@@ -624,6 +1350,13 @@ def main():
         show_status(config)
         return
 
+    if args.daemon:
+        try:
+            run_daemon(config, push=args.push, interval=args.interval)
+        except KeyboardInterrupt:
+            print("\nStopped")
+        return
+
     # Default: sync
     stats = sync_all(config, push=args.push)
     print(f"\nSync complete: {stats}")